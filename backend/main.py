@@ -5,17 +5,33 @@ Main entry point with all routes
 ============================================================================
 """
 
-from fastapi import FastAPI, HTTPException, Depends, File, UploadFile, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, File, Form, UploadFile, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
 import uuid
 import os
+import threading
+import time
+from calendar import timegm
+import httpx
 import jwt
+import orjson
+import redis.asyncio as redis
 from passlib.context import CryptContext
 
+from services.question_detector import QuestionDetectorService
+from services.resume_parser import ResumeParserService
+
 # ============================================================================
 # App Configuration
 # ============================================================================
@@ -24,6 +40,7 @@ app = FastAPI(
     title="RedParrot API",
     description="AI-Powered Interview Copilot Backend",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Configuration
@@ -35,6 +52,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (Q&A history, generated answers). Small
+# responses such as transcriptions stay under minimum_size and pass through;
+# level 5 keeps most of the ratio of level 9 at a fraction of the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Security
 SECRET_KEY = os.getenv("SECRET_KEY", "redparrot-secret-key-change-in-production")
 ALGORITHM = "HS256"
@@ -43,6 +65,20 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
+# Token signing: the header segment and HMAC key schedule never change, so
+# build them once and copy the keyed HMAC per token
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(
+    orjson.dumps({"alg": ALGORITHM, "typ": "JWT"})
+).rstrip(b"=")
+_JWT_HMAC = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+# Decoded token cache: token -> (payload, expires_at). Keyed by the raw bearer
+# string on purpose; the dict's own str hash is cheaper than pre-hashing with
+# hashlib, so don't add a digest step here.
+JWT_CACHE_MAX_SIZE = 10000
+JWT_CACHE_TTL_SECONDS = 300
+_jwt_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+
 # ============================================================================
 # Pydantic Models
 # ============================================================================
@@ -135,12 +171,97 @@ class QuestionAnswerPair(BaseModel):
     timestamp: datetime
 
 # ============================================================================
-# In-Memory Storage (Replace with PostgreSQL in production)
+# Storage (Redis, shared by all workers)
+#
+#   user:{id}                hash    user record
+#   email_idx:{email}        string  user id
+#   session:{id}             hash    session record
+#   user_sessions:{user_id}  list    session ids owned by the user, newest first
+#   qa:{session_id}          list    JSON-encoded Q&A pairs
 # ============================================================================
 
-users_db: Dict[str, Dict] = {}
-sessions_db: Dict[str, Dict] = {}
-qa_history_db: Dict[str, List[Dict]] = {}
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+
+def to_redis_hash(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a record for HSET: None fields are omitted, datetimes stored as ISO strings"""
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in record.items()
+        if value is not None
+    }
+
+def user_from_redis(raw: Dict[str, str]) -> Dict[str, Any]:
+    """Restore field types on a user hash read back from Redis"""
+    return {
+        **raw,
+        "name": raw.get("name"),
+        "created_at": datetime.fromisoformat(raw["created_at"]),
+        "credits": int(raw["credits"]),
+    }
+
+def session_from_redis(raw: Dict[str, str]) -> Dict[str, Any]:
+    """Shape a session hash read back from Redis as a JSON-ready SessionResponse dict"""
+    return {
+        "id": raw["id"],
+        "user_id": raw["user_id"],
+        "company_name": raw.get("company_name"),
+        "job_title": raw.get("job_title"),
+        "started_at": raw["started_at"],
+        "ended_at": raw.get("ended_at"),
+        "questions_count": int(raw.get("questions_count", 0)),
+    }
+
+@app.on_event("shutdown")
+async def close_redis():
+    await redis_client.aclose()
+
+# ============================================================================
+# Outbound HTTP (one pooled client per worker keeps Groq connections warm)
+# ============================================================================
+
+@app.on_event("startup")
+async def open_http_client():
+    app.state.http = httpx.AsyncClient(
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        http2=True,
+    )
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await app.state.http.aclose()
+
+# ============================================================================
+# Services (created once per worker)
+# ============================================================================
+
+DETECTOR_CACHE_MAX_USERS = 1000
+
+# detect_question runs in the threadpool; guards the detector map and buffers
+_detectors_lock = threading.Lock()
+
+@app.on_event("startup")
+async def init_services():
+    app.state.resume_parser = ResumeParserService()
+    # Question detectors buffer partial transcriptions, so keep one per user
+    app.state.detectors = {}
+
+@app.on_event("shutdown")
+async def close_services():
+    app.state.resume_parser.close()
+
+def get_question_detector(user_id: str) -> QuestionDetectorService:
+    """Get the user's detector, evicting the least recently used past the cap"""
+    detectors = app.state.detectors
+    detector = detectors.pop(user_id, None)
+    if detector is None:
+        detector = QuestionDetectorService()
+        if len(detectors) >= DETECTOR_CACHE_MAX_USERS:
+            del detectors[next(iter(detectors))]
+    detectors[user_id] = detector
+    return detector
 
 # ============================================================================
 # Authentication Helpers
@@ -153,18 +274,52 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    """Encode an HS256 JWT (equivalent to jwt.encode, minus the per-call setup)"""
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=15))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": timegm(expire.utctimetuple())})
+    
+    payload_b64 = base64.urlsafe_b64encode(orjson.dumps(to_encode)).rstrip(b"=")
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    
+    mac = _JWT_HMAC.copy()
+    mac.update(signing_input)
+    signature_b64 = base64.urlsafe_b64encode(mac.digest()).rstrip(b"=")
+    
+    return (signing_input + b"." + signature_b64).decode()
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """Decode a JWT, reusing the cached payload for recently verified tokens"""
+    now = time.time()
+    cached = _jwt_cache.get(token)
+    if cached is not None:
+        payload, expires_at = cached
+        if now < expires_at:
+            return payload
+        del _jwt_cache[token]
+    
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    
+    # Never keep an entry past the token's own expiry
+    expires_at = min(now + JWT_CACHE_TTL_SECONDS, payload.get("exp", now))
+    if expires_at > now:
+        if len(_jwt_cache) >= JWT_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _jwt_cache[next(iter(_jwt_cache))]
+        _jwt_cache[token] = (payload, expires_at)
+    
+    return payload
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_access_token(token)
         user_id: str = payload.get("sub")
-        if user_id is None or user_id not in users_db:
+        if user_id is None:
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        raw_user = await redis_client.hgetall(f"user:{user_id}")
+        if not raw_user:
             raise HTTPException(status_code=401, detail="Invalid credentials")
-        return users_db[user_id]
+        return user_from_redis(raw_user)
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
@@ -186,22 +341,31 @@ async def health_check():
 
 @app.post("/api/auth/register", response_model=Token)
 async def register(user_data: UserCreate):
-    # Check if user exists
-    for user in users_db.values():
-        if user["email"] == user_data.email:
-            raise HTTPException(status_code=400, detail="Email already registered")
-    
-    # Create user
+    # Claim the email atomically (SET NX) so concurrent registrations can't both
+    # win, and before hashing so duplicates don't cost a bcrypt round
     user_id = str(uuid.uuid4())
-    user = {
-        "id": user_id,
-        "email": user_data.email,
-        "password_hash": get_password_hash(user_data.password),
-        "name": user_data.name,
-        "created_at": datetime.utcnow(),
-        "credits": 100,  # Free credits
-    }
-    users_db[user_id] = user
+    email_key = f"email_idx:{user_data.email}"
+    if not await redis_client.set(email_key, user_id, nx=True):
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    try:
+        # bcrypt is CPU-bound; hash in a worker thread so the event loop stays free
+        password_hash = await asyncio.to_thread(get_password_hash, user_data.password)
+        
+        # Create user
+        user = {
+            "id": user_id,
+            "email": user_data.email,
+            "password_hash": password_hash,
+            "name": user_data.name,
+            "created_at": datetime.utcnow(),
+            "credits": 100,  # Free credits
+        }
+        await redis_client.hset(f"user:{user_id}", mapping=to_redis_hash(user))
+    except BaseException:
+        # Release the claim so a failed registration can't lock the address
+        await redis_client.delete(email_key)
+        raise
     
     # Generate token
     access_token = create_access_token(
@@ -224,12 +388,14 @@ async def register(user_data: UserCreate):
 async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     # Find user
     user = None
-    for u in users_db.values():
-        if u["email"] == form_data.username:
-            user = u
-            break
-    
-    if not user or not verify_password(form_data.password, user["password_hash"]):
+    user_id = await redis_client.get(f"email_idx:{form_data.username}")
+    if user_id:
+        raw_user = await redis_client.hgetall(f"user:{user_id}")
+        user = user_from_redis(raw_user) if raw_user else None
+    
+    if not user or not await asyncio.to_thread(
+        verify_password, form_data.password, user["password_hash"]
+    ):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Generate token
@@ -249,20 +415,47 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
         )
     )
 
+# Hot read endpoints below return a Response directly: FastAPI then skips
+# re-validating and re-encoding through response_model (kept for the docs)
+
 @app.get("/api/auth/me", response_model=UserResponse)
 async def get_me(current_user: Dict = Depends(get_current_user)):
-    return UserResponse(
-        id=current_user["id"],
-        email=current_user["email"],
-        name=current_user["name"],
-        created_at=current_user["created_at"],
-        credits=current_user["credits"],
-    )
+    return ORJSONResponse({
+        "id": current_user["id"],
+        "email": current_user["email"],
+        "name": current_user["name"],
+        "created_at": current_user["created_at"],
+        "credits": current_user["credits"],
+    })
 
 # ============================================================================
 # Routes: Transcription
 # ============================================================================
 
+async def call_groq_transcription(
+    groq_api_key: str,
+    file: Tuple[str, Any, str],
+    language: str
+) -> Dict[str, Any]:
+    """Send an audio file (bytes or file object) to Groq Whisper"""
+    data = {"model": "whisper-large-v3"}
+    
+    if language != "auto":
+        data["language"] = language
+    
+    response = await app.state.http.post(
+        "https://api.groq.com/openai/v1/audio/transcriptions",
+        headers={"Authorization": f"Bearer {groq_api_key}"},
+        files={"file": file},
+        data=data,
+        timeout=30.0
+    )
+    
+    if response.status_code != 200:
+        raise HTTPException(status_code=500, detail=f"Groq API error: {response.text}")
+    
+    return response.json()
+
 @app.post("/api/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(
     request: TranscriptionRequest,
@@ -272,48 +465,64 @@ async def transcribe_audio(
     Transcribe audio using Groq Whisper API
     This endpoint is optional - the Electron app can call Groq directly
     """
-    import base64
-    import httpx
-    
     groq_api_key = os.getenv("GROQ_API_KEY")
     if not groq_api_key:
         raise HTTPException(status_code=500, detail="GROQ_API_KEY not configured")
     
     try:
-        # Decode audio
-        audio_data = base64.b64decode(request.audio_base64)
+        # Decode audio off the event loop (payloads can be several MB)
+        audio_data = await asyncio.to_thread(base64.b64decode, request.audio_base64)
         
         # Call Groq Whisper API
-        async with httpx.AsyncClient() as client:
-            files = {"file": ("audio.wav", audio_data, "audio/wav")}
-            data = {"model": "whisper-large-v3"}
-            
-            if request.language != "auto":
-                data["language"] = request.language
-            
-            response = await client.post(
-                "https://api.groq.com/openai/v1/audio/transcriptions",
-                headers={"Authorization": f"Bearer {groq_api_key}"},
-                files=files,
-                data=data,
-                timeout=30.0
-            )
-            
-            if response.status_code != 200:
-                raise HTTPException(status_code=500, detail=f"Groq API error: {response.text}")
-            
-            result = response.json()
-            
-            # Deduct credits
-            users_db[current_user["id"]]["credits"] -= 1
-            
-            return TranscriptionResponse(
-                text=result.get("text", ""),
-                language=result.get("language", "unknown"),
-                confidence=1.0,
-                duration=len(audio_data) / 32000  # Approximate
-            )
-            
+        result = await call_groq_transcription(
+            groq_api_key, ("audio.wav", audio_data, "audio/wav"), request.language
+        )
+        
+        # Deduct credits (atomic across workers)
+        await redis_client.hincrby(f"user:{current_user['id']}", "credits", -1)
+        
+        return TranscriptionResponse(
+            text=result.get("text", ""),
+            language=result.get("language", "unknown"),
+            confidence=1.0,
+            duration=len(audio_data) / 32000  # Approximate
+        )
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/transcribe/stream", response_model=TranscriptionResponse)
+async def transcribe_audio_stream(
+    file: UploadFile = File(...),
+    language: str = Form("auto"),
+    current_user: Dict = Depends(get_current_user)
+):
+    """
+    Transcribe a multipart audio upload using Groq Whisper API
+    The spooled upload is streamed to Groq without base64 or an in-memory copy
+    """
+    groq_api_key = os.getenv("GROQ_API_KEY")
+    if not groq_api_key:
+        raise HTTPException(status_code=500, detail="GROQ_API_KEY not configured")
+    
+    try:
+        await file.seek(0)
+        result = await call_groq_transcription(
+            groq_api_key,
+            (file.filename or "audio.wav", file.file, file.content_type or "audio/wav"),
+            language
+        )
+        
+        # Deduct credits (atomic across workers)
+        await redis_client.hincrby(f"user:{current_user['id']}", "credits", -1)
+        
+        return TranscriptionResponse(
+            text=result.get("text", ""),
+            language=result.get("language", "unknown"),
+            confidence=1.0,
+            duration=(file.size or 0) / 32000  # Approximate
+        )
+        
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -322,17 +531,17 @@ async def transcribe_audio(
 # ============================================================================
 
 @app.post("/api/detect-question", response_model=Optional[DetectedQuestion])
-async def detect_question(
+def detect_question(
     request: QuestionDetectionRequest,
     current_user: Dict = Depends(get_current_user)
 ):
     """
     Detect if text contains an interview question
+    Plain def: FastAPI runs the CPU-bound regex work in its threadpool
     """
-    from services.question_detector import QuestionDetectorService
-    
-    detector = QuestionDetectorService()
-    result = detector.detect_question(request.text)
+    with _detectors_lock:
+        detector = get_question_detector(current_user["id"])
+        result = detector.detect_question(request.text)
     
     if result:
         return DetectedQuestion(
@@ -349,6 +558,16 @@ async def detect_question(
 # Routes: Answer Generation
 # ============================================================================
 
+ANSWER_CACHE_TTL_SECONDS = 60 * 60 * 24  # 1 day
+
+def answer_cache_key(request: AnswerGenerationRequest) -> str:
+    """Content-addressed Redis key for a generated answer"""
+    digest = hashlib.blake2b(
+        json.dumps(request.model_dump(), sort_keys=True, default=str).encode(),
+        digest_size=16
+    ).hexdigest()
+    return f"ans:{digest}"
+
 @app.post("/api/generate-answer", response_model=GeneratedAnswer)
 async def generate_answer(
     request: AnswerGenerationRequest,
@@ -357,12 +576,17 @@ async def generate_answer(
     """
     Generate answer using Groq Llama 3.3 70B
     """
-    import httpx
-    
     groq_api_key = os.getenv("GROQ_API_KEY")
     if not groq_api_key:
         raise HTTPException(status_code=500, detail="GROQ_API_KEY not configured")
     
+    # Identical requests (e.g. "Tell me about yourself") are served from cache
+    # without calling Groq or deducting credits
+    cache_key = answer_cache_key(request)
+    cached = await redis_client.get(cache_key)
+    if cached:
+        return GeneratedAnswer.model_validate_json(cached)
+    
     # Build prompt
     length_config = {
         "short": {"words": 75, "duration": 30},
@@ -393,38 +617,40 @@ Question: {request.question}
     prompt += "\n\nGenerate the answer now. Start directly with the response."
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {groq_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "llama-3.3-70b-versatile",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.7,
-                    "max_tokens": 1024
-                },
-                timeout=60.0
-            )
-            
-            if response.status_code != 200:
-                raise HTTPException(status_code=500, detail=f"Groq API error: {response.text}")
-            
-            result = response.json()
-            answer_text = result["choices"][0]["message"]["content"]
-            
-            # Deduct credits
-            users_db[current_user["id"]]["credits"] -= 2
-            
-            return GeneratedAnswer(
-                text=answer_text.strip(),
-                length=request.length,
-                estimated_duration=config["duration"],
-                format="STAR" if request.question_type == "behavioral" else "technical"
-            )
-            
+        response = await app.state.http.post(
+            "https://api.groq.com/openai/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {groq_api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "llama-3.3-70b-versatile",
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.7,
+                "max_tokens": 1024
+            },
+            timeout=60.0
+        )
+        
+        if response.status_code != 200:
+            raise HTTPException(status_code=500, detail=f"Groq API error: {response.text}")
+        
+        result = response.json()
+        answer_text = result["choices"][0]["message"]["content"]
+        
+        # Deduct credits (atomic across workers)
+        await redis_client.hincrby(f"user:{current_user['id']}", "credits", -2)
+        
+        answer = GeneratedAnswer(
+            text=answer_text.strip(),
+            length=request.length,
+            estimated_duration=config["duration"],
+            format="STAR" if request.question_type == "behavioral" else "technical"
+        )
+        await redis_client.set(cache_key, answer.model_dump_json(), ex=ANSWER_CACHE_TTL_SECONDS)
+        
+        return answer
+        
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -440,11 +666,6 @@ async def parse_resume(
     """
     Parse uploaded resume file
     """
-    from services.resume_parser import ResumeParserService
-    
-    # Read file
-    content = await file.read()
-    
     # Determine file type
     file_type = "txt"
     if file.filename.endswith(".pdf"):
@@ -453,10 +674,13 @@ async def parse_resume(
         file_type = "docx"
     
     # Parse
-    parser = ResumeParserService()
+    parser = app.state.resume_parser
     
     try:
-        result = await parser.parse_bytes(content, file_type)
+        # UploadFile is already spooled to disk past 1 MB; parse the file object
+        # directly in a worker thread instead of reading it all into memory
+        await file.seek(0)
+        result = await asyncio.to_thread(parser.parse_stream, file.file, file_type)
         return ParsedResume(**result)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse resume: {str(e)}")
@@ -481,20 +705,25 @@ async def create_session(
         "ended_at": None,
         "questions_count": 0
     }
-    sessions_db[session_id] = session
-    qa_history_db[session_id] = []
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(f"session:{session_id}", mapping=to_redis_hash(session))
+        pipe.lpush(f"user_sessions:{current_user['id']}", session_id)
+        await pipe.execute()
     
     return SessionResponse(**session)
 
 @app.get("/api/sessions", response_model=List[SessionResponse])
 async def get_sessions(current_user: Dict = Depends(get_current_user)):
     """Get all sessions for current user"""
-    user_sessions = [
-        SessionResponse(**s) 
-        for s in sessions_db.values() 
-        if s["user_id"] == current_user["id"]
-    ]
-    return sorted(user_sessions, key=lambda x: x.started_at, reverse=True)
+    # Index is kept newest first by create_session, so no sort is needed
+    session_ids = await redis_client.lrange(f"user_sessions:{current_user['id']}", 0, -1)
+    
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for session_id in session_ids:
+            pipe.hgetall(f"session:{session_id}")
+        sessions = await pipe.execute()
+    
+    return ORJSONResponse([session_from_redis(s) for s in sessions if s])
 
 @app.get("/api/sessions/{session_id}", response_model=SessionResponse)
 async def get_session(
@@ -502,10 +731,10 @@ async def get_session(
     current_user: Dict = Depends(get_current_user)
 ):
     """Get session by ID"""
-    if session_id not in sessions_db:
+    session = await redis_client.hgetall(f"session:{session_id}")
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions_db[session_id]
     if session["user_id"] != current_user["id"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
@@ -517,15 +746,22 @@ async def end_session(
     current_user: Dict = Depends(get_current_user)
 ):
     """End an interview session"""
-    if session_id not in sessions_db:
+    session = await redis_client.hgetall(f"session:{session_id}")
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions_db[session_id]
     if session["user_id"] != current_user["id"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
     session["ended_at"] = datetime.utcnow()
-    session["questions_count"] = len(qa_history_db.get(session_id, []))
+    session["questions_count"] = await redis_client.llen(f"qa:{session_id}")
+    await redis_client.hset(
+        f"session:{session_id}",
+        mapping=to_redis_hash({
+            "ended_at": session["ended_at"],
+            "questions_count": session["questions_count"],
+        })
+    )
     
     return SessionResponse(**session)
 
@@ -536,19 +772,16 @@ async def add_qa_pair(
     current_user: Dict = Depends(get_current_user)
 ):
     """Add a question-answer pair to session"""
-    if session_id not in sessions_db:
+    session = await redis_client.hgetall(f"session:{session_id}")
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions_db[session_id]
     if session["user_id"] != current_user["id"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    if session_id not in qa_history_db:
-        qa_history_db[session_id] = []
-    
-    qa_history_db[session_id].append(qa_pair.dict())
+    count = await redis_client.rpush(f"qa:{session_id}", qa_pair.model_dump_json())
     
-    return {"status": "ok", "count": len(qa_history_db[session_id])}
+    return {"status": "ok", "count": count}
 
 @app.get("/api/sessions/{session_id}/qa", response_model=List[QuestionAnswerPair])
 async def get_qa_history(
@@ -556,14 +789,16 @@ async def get_qa_history(
     current_user: Dict = Depends(get_current_user)
 ):
     """Get Q&A history for session"""
-    if session_id not in sessions_db:
+    session = await redis_client.hgetall(f"session:{session_id}")
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions_db[session_id]
     if session["user_id"] != current_user["id"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    return qa_history_db.get(session_id, [])
+    # Pairs are stored as validated JSON, so splice them into an array as-is
+    qa_pairs = await redis_client.lrange(f"qa:{session_id}", 0, -1)
+    return Response(content="[" + ",".join(qa_pairs) + "]", media_type="application/json")
 
 # ============================================================================
 # Routes: User Credits
@@ -580,4 +815,6 @@ async def get_credits(current_user: Dict = Depends(get_current_user)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # loop/http default to "auto": uvloop and httptools where uvicorn[standard]
+    # installs them (not on Windows), asyncio and h11 otherwise
+    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -6,7 +6,9 @@ Detects interview questions from transcribed text
 """
 
 import re
-from typing import Optional, Dict, List, Any
+from collections import deque
+from itertools import islice
+from typing import Optional, Dict, List, Any, Tuple
 
 # Question pattern matchers
 QUESTION_PATTERNS = {
@@ -92,6 +94,46 @@ QUESTION_INDICATORS = [
     "tell me", "describe", "explain", "share", "walk me through",
 ]
 
+INTERVIEW_PHRASES = [
+    "tell me about", "walk me through", "describe",
+    "explain", "what is your", "how do you", "why do you",
+]
+
+# Literal scans collapsed into single C-level calls
+_INDICATOR_PREFIXES = tuple(
+    indicator + sep for indicator in QUESTION_INDICATORS for sep in (" ", ",")
+)
+_INDICATOR_FIRST_WORDS = tuple(
+    dict.fromkeys(indicator.split()[0] for indicator in QUESTION_INDICATORS)
+)
+_RE_INTERVIEW_PHRASES = re.compile("|".join(map(re.escape, INTERVIEW_PHRASES)))
+
+# One alternation per question type, so each type costs a single scan.
+# Group "g<i>" identifies which of the type's patterns matched.
+_UNION_BY_TYPE: Dict[str, Tuple[re.Pattern, List[str]]] = {
+    q_type: (
+        re.compile(
+            "|".join(f"(?P<g{i}>{p})" for i, p in enumerate(patterns)),
+            re.IGNORECASE
+        ),
+        patterns,
+    )
+    for q_type, patterns in QUESTION_PATTERNS.items()
+}
+
+_RE_ENDS_WITH_PUNCTUATION = re.compile(r'[.?!]$')
+
+# Word vocabularies, matched against a single \w+ tokenization of the text
+# (a token equals a vocabulary word exactly when \bword\b would match)
+_RE_WORD = re.compile(r'\w+')
+QUESTION_WORDS = frozenset([
+    "what", "how", "why", "when", "where", "who", "which", "tell", "describe", "explain",
+])
+TECHNICAL_TERMS = frozenset([
+    "api", "database", "algorithm", "function", "class", "system", "design",
+    "performance", "security", "testing", "deployment",
+])
+
 
 class QuestionDetectorService:
     """
@@ -102,7 +144,10 @@ class QuestionDetectorService:
         self.transcription_buffer = ""
         self.last_question_time = 0
         self.min_question_gap_ms = 5000
-        self.detected_questions: List[Dict] = []
+        self.max_history = 200
+        # Stop scanning further question types once a match is this confident
+        self.early_exit_confidence = 0.9
+        self.detected_questions: deque = deque(maxlen=self.max_history)
     
     def detect_question(self, text: str) -> Optional[Dict[str, Any]]:
         """
@@ -134,16 +179,14 @@ class QuestionDetectorService:
         text = text.strip()
         
         # Ends with punctuation
-        if re.search(r'[.?!]$', text):
+        if _RE_ENDS_WITH_PUNCTUATION.search(text):
             return True
         
         # Long enough and starts with question word
         words = text.split()
         if len(words) >= 8:
-            first_word = words[0].lower()
-            for indicator in QUESTION_INDICATORS:
-                if first_word.startswith(indicator.split()[0]):
-                    return True
+            if words[0].lower().startswith(_INDICATOR_FIRST_WORDS):
+                return True
         
         return False
     
@@ -160,14 +203,19 @@ class QuestionDetectorService:
         highest_confidence = 0.0
         matched_keywords: List[str] = []
         
-        for q_type, patterns in QUESTION_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, lower_text, re.IGNORECASE):
-                    confidence = self._calculate_confidence(lower_text, pattern)
-                    if confidence > highest_confidence:
-                        highest_confidence = confidence
-                        matched_type = q_type
-                        matched_keywords = self._extract_keywords(lower_text, pattern)
+        for q_type, (union, patterns) in _UNION_BY_TYPE.items():
+            match = union.search(lower_text)
+            if match:
+                # Every alternative is a named group "g<index>"
+                assert match.lastgroup is not None
+                pattern = patterns[int(match.lastgroup[1:])]
+                confidence = self._calculate_confidence(lower_text, pattern)
+                if confidence > highest_confidence:
+                    highest_confidence = confidence
+                    matched_type = q_type
+                    matched_keywords = self._extract_keywords(lower_text, pattern)
+                    if highest_confidence >= self.early_exit_confidence:
+                        break
         
         # If no specific pattern but looks like question
         if highest_confidence == 0 and self._looks_like_question(lower_text):
@@ -193,20 +241,10 @@ class QuestionDetectorService:
         if "?" in text:
             return True
         
-        for indicator in QUESTION_INDICATORS:
-            if text.startswith(indicator + " ") or text.startswith(indicator + ","):
-                return True
-        
-        interview_phrases = [
-            "tell me about", "walk me through", "describe",
-            "explain", "what is your", "how do you", "why do you",
-        ]
-        
-        for phrase in interview_phrases:
-            if phrase in text:
-                return True
+        if text.startswith(_INDICATOR_PREFIXES):
+            return True
         
-        return False
+        return _RE_INTERVIEW_PHRASES.search(text) is not None
     
     def _calculate_confidence(self, text: str, pattern: str) -> float:
         """Calculate confidence score"""
@@ -215,11 +253,10 @@ class QuestionDetectorService:
         if "?" in text:
             confidence += 0.2
         
-        question_words = re.findall(
-            r'\b(what|how|why|when|where|who|which|tell|describe|explain)\b',
-            text, re.IGNORECASE
+        question_word_count = sum(
+            1 for word in _RE_WORD.findall(text.lower()) if word in QUESTION_WORDS
         )
-        if len(question_words) > 1:
+        if question_word_count > 1:
             confidence += 0.1
         
         if len(text.split()) < 5:
@@ -232,11 +269,10 @@ class QuestionDetectorService:
         keywords = []
         
         # Extract technical terms
-        technical_terms = re.findall(
-            r'\b(api|database|algorithm|function|class|system|design|performance|security|testing|deployment)\b',
-            text, re.IGNORECASE
-        )
-        keywords.extend([t.lower() for t in technical_terms])
+        technical_terms = [
+            word for word in _RE_WORD.findall(text.lower()) if word in TECHNICAL_TERMS
+        ]
+        keywords.extend(technical_terms)
         
         return list(set(keywords))[:5]
     
@@ -249,7 +285,7 @@ class QuestionDetectorService:
             cleaned = cleaned[0].upper() + cleaned[1:]
         
         # Ensure ends with punctuation
-        if not re.search(r'[.?!]$', cleaned):
+        if not _RE_ENDS_WITH_PUNCTUATION.search(cleaned):
             cleaned += "?"
         
         return cleaned
@@ -269,9 +305,10 @@ class QuestionDetectorService:
     
     def get_recent_questions(self, count: int = 10) -> List[Dict]:
         """Get recent detected questions"""
-        return self.detected_questions[-count:]
+        start = max(0, len(self.detected_questions) - count)
+        return list(islice(self.detected_questions, start, None))
     
     def clear_history(self):
         """Clear question history"""
-        self.detected_questions = []
+        self.detected_questions.clear()
         self.transcription_buffer = ""
@@ -2,13 +2,35 @@
 ============================================================================
 RedParrot - Resume Parser Service (Python)
 Parses PDF and DOCX resumes to extract structured data
+
+Kept mypy-clean so it can be compiled with mypyc (see Dockerfile):
+    mypyc --ignore-missing-imports services/resume_parser.py
 ============================================================================
 """
 
+import asyncio
+import copy
+import hashlib
+import multiprocessing
+import os
 import re
-from typing import Optional, Dict, List, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, BinaryIO, Callable, Tuple
 from io import BytesIO
 
+# Parsed results keyed by (content digest, file type), least recently used first
+PARSE_CACHE_MAX_ENTRIES = 256
+_PARSE_CACHE: "OrderedDict[Tuple[bytes, str], Dict[str, Any]]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# A PDF still extracting after this long has its worker killed (e.g. a
+# decompression bomb); the request fails and the pool is replaced
+PDF_EXTRACT_TIMEOUT_SECONDS = 30.0
+
 # Skill keywords for extraction
 SKILL_KEYWORDS = [
     # Programming Languages
@@ -33,18 +55,306 @@ EXPERIENCE_HEADERS = [
     "work history", "career history", "professional background",
 ]
 
+SUMMARY_HEADERS = ["summary", "professional summary", "about", "profile", "objective"]
+
+# Header words per section; "other" headers only mark where a section ends
+SECTION_HEADERS = {
+    "summary": SUMMARY_HEADERS,
+    "experience": EXPERIENCE_HEADERS,
+    "skills": ["skills", "technical skills", "technologies"],
+    "education": ["education", "academic"],
+    "projects": ["projects", "personal projects", "side projects"],
+    "other": ["certifications", "awards", "references", "contact"],
+}
+
+# Skills are matched as whole tokens, so "r" no longer hits "architecture" nor
+# "java" hits "javascript". A token may contain inner dots ("node.js") but not
+# a trailing one, so "python." at the end of a sentence still counts.
+_RE_SKILL_TOKEN = re.compile(r"[a-z0-9+#][a-z0-9+#\-]*(?:\.[a-z0-9+#\-]+)*")
+# Compound tokens are also matched by their parts: "react.js" -> "react",
+# "kubernetes-based" -> "kubernetes", while "node.js" still matches whole
+_SKILL_PART_TABLE = str.maketrans({"-": "."})
+_DIGITS = "0123456789"
+_SKILL_PHRASES = [skill for skill in SKILL_KEYWORDS if " " in skill]
+_RE_SKILL_PHRASE = re.compile(
+    r"(?<![a-z0-9+#.\-])("
+    + "|".join(r"\s+".join(map(re.escape, phrase.split())) for phrase in _SKILL_PHRASES)
+    + r")(?![a-z0-9+#\-])"
+)
+
+
+def _find_skill_keywords(lower_text: str) -> List[str]:
+    """
+    Known skills occurring as whole words in lowercased text, in SKILL_KEYWORDS order
+
+    >>> _find_skill_keywords(
+    ...     "built kubernetes-based pipelines with react.js and vue.js, express.js apis, "
+    ...     "python3, rest apis, aws-hosted, docker-compose; software architecture"
+    ... )
+    ['python', 'react', 'vue', 'express', 'aws', 'docker', 'kubernetes', 'rest', 'api']
+    """
+    tokens = set(_RE_SKILL_TOKEN.findall(lower_text))
+    found = set(tokens)
+    
+    for token in tokens:
+        for part in token.translate(_SKILL_PART_TABLE).split("."):
+            found.add(part)
+            # Version suffixes and plurals: "python3" -> "python", "apis" -> "api"
+            base = part.rstrip(_DIGITS)
+            if len(base) > 1:
+                found.add(base)
+            if len(part) > 3 and part.endswith("s"):
+                found.add(part[:-1])
+    
+    found.update(" ".join(m.split()) for m in _RE_SKILL_PHRASE.findall(lower_text))
+    return [skill for skill in SKILL_KEYWORDS if skill in found]
+
+
+def _content_digest() -> "hashlib.blake2b":
+    """Hash used for parse cache keys"""
+    return hashlib.blake2b(digest_size=16)
+
+
+def _cache_get(key: Tuple[bytes, str]) -> Optional[Dict[str, Any]]:
+    """Cached parse result for key, if any"""
+    with _PARSE_CACHE_LOCK:
+        result = _PARSE_CACHE.get(key)
+        if result is None:
+            return None
+        _PARSE_CACHE.move_to_end(key)
+    # Copies keep callers from mutating the cached entry
+    return copy.deepcopy(result)
+
+
+def _cache_put(key: Tuple[bytes, str], result: Dict[str, Any]) -> None:
+    """Store a parse result, evicting the least recently used past the cap"""
+    result = copy.deepcopy(result)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = result
+        _PARSE_CACHE.move_to_end(key)
+        if len(_PARSE_CACHE) > PARSE_CACHE_MAX_ENTRIES:
+            _PARSE_CACHE.popitem(last=False)
+
+
+def _build_pdf_extractor() -> Callable[[bytes], str]:
+    """Resolve the first available PDF backend (PyMuPDF, pypdfium2, pdfplumber, PyPDF2)"""
+    # pypdfium2 is the pinned default. PyMuPDF is AGPL-licensed and left out of
+    # requirements.txt; it is only picked up if the deployer installs it.
+    # PyMuPDF and pypdfium2 take the bytes as-is; keep it that way, as a
+    # BytesIO wrapper costs a copy per document. pdfplumber and PyPDF2 only
+    # accept paths or file objects, so they get one.
+    try:
+        import fitz  # type: ignore[import]  # PyMuPDF, optional (AGPL)
+    except ImportError:
+        pass
+    else:
+        def extract_pymupdf(content: bytes) -> str:
+            with fitz.open(stream=content, filetype="pdf") as doc:
+                return "\n".join([page.get_text("text") for page in doc])
+        return extract_pymupdf
+    
+    try:
+        import pypdfium2 as pdfium  # type: ignore[import]
+    except ImportError:
+        pass
+    else:
+        def extract_pdfium(content: bytes) -> str:
+            pdf = pdfium.PdfDocument(content)
+            try:
+                return "\n".join([page.get_textpage().get_text_range() for page in pdf])
+            finally:
+                pdf.close()
+        return extract_pdfium
+    
+    try:
+        import pdfplumber  # type: ignore[import]
+    except ImportError:
+        pass
+    else:
+        def extract_pdfplumber(content: bytes) -> str:
+            with pdfplumber.open(BytesIO(content)) as pdf:
+                return "\n".join([page.extract_text() or "" for page in pdf.pages])
+        return extract_pdfplumber
+    
+    try:
+        from PyPDF2 import PdfReader  # type: ignore[import]
+    except ImportError:
+        return lambda content: "[PDF parsing requires PyMuPDF, pypdfium2, pdfplumber or PyPDF2]"
+    
+    def extract_pypdf2(content: bytes) -> str:
+        reader = PdfReader(BytesIO(content))
+        return "\n".join([page.extract_text() or "" for page in reader.pages])
+    return extract_pypdf2
+
+
+# Resolved on first use in each PDF worker, so the API process never imports
+# the PDF engines
+_pdf_extract: Optional[Callable[[bytes], str]] = None
+
+
+def _extract_pdf_text(content: bytes) -> str:
+    """
+    Extract text from PDF bytes with the resolved backend
+    Module-level so it can run in the service's PDF process pool
+    """
+    global _pdf_extract
+    if _pdf_extract is None:
+        _pdf_extract = _build_pdf_extractor()
+    return _pdf_extract(content)
+
+
+def _build_docx_reader() -> Callable[[BinaryIO], str]:
+    """Resolve python-docx once, or a reader returning the install hint"""
+    try:
+        import docx  # type: ignore[import]
+    except ImportError:
+        return lambda stream: "[DOCX parsing requires python-docx]"
+    
+    def read_docx(stream: BinaryIO) -> str:
+        doc = docx.Document(stream)
+        return "\n".join([para.text for para in doc.paragraphs])
+    return read_docx
+
+
+def _split_sections(text: str) -> Dict[str, str]:
+    """Map each section to its body (up to the next header line), in one scan"""
+    sections: Dict[str, str] = {}
+    headers = list(_RE_SECTION_HEADER.finditer(text))
+    
+    for i, header in enumerate(headers):
+        section = _HEADER_TO_SECTION[header.group(1).lower()]
+        if section not in sections:
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+            sections[section] = text[header.end():end].strip()
+    
+    return sections
+
+
+def _first_paragraph(text: str) -> str:
+    """Text up to the first blank line"""
+    return text.split("\n\n", 1)[0]
+
+# Patterns compiled once at import
+_RE_SPACES = re.compile(r" +")
+_RE_BLANK_LINES = re.compile(r"\n\s*\n")
+_RE_NAME = re.compile(r'^([A-Z][a-z]+\s+){1,3}[A-Z][a-z]+$')
+_RE_TITLE = re.compile(
+    r"senior|junior|lead|principal|staff|engineer|developer|manager|director|analyst|designer|architect|consultant",
+    re.IGNORECASE
+)
+
+# Line-level header check used by _is_section_header
+_SECTION_HEADER_WORDS = frozenset(EXPERIENCE_HEADERS + [
+    "education", "skills", "projects", "certifications", "awards",
+    "summary", "objective", "contact", "references",
+])
+
+# A section header starts a line and is either alone on it ("Experience") or
+# followed by a colon and inline content ("Skills: Python, Go")
+_HEADER_TO_SECTION = {
+    header: section for section, headers in SECTION_HEADERS.items() for header in headers
+}
+_RE_SECTION_HEADER = re.compile(
+    r"^[ \t]*("
+    + "|".join(re.escape(h) for h in sorted(_HEADER_TO_SECTION, key=len, reverse=True))
+    + r")[ \t]*(?::|$)",
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Possessive/atomic forms (stdlib re, Python 3.11+) only where backtracking
+# can never produce a different match: runs of \s* followed by a non-space
+# token, and the trailing optional parts. The captures themselves rely on
+# backtracking, so they stay as plain greedy groups.
+_RE_EXPERIENCE_ITEM = re.compile(
+    r"([A-Z][^•\n]+)\s*+[|•\-–]\s*([^•\n]+)\s*+[|•\-–]?+\s*+(\d{4}\s*+[-–]\s*+(?>\d{4}|present|current))?",
+    re.IGNORECASE
+)
+# Skill list delimiters folded onto "," so one str.split does the work
+_SKILL_DELIM_TABLE = str.maketrans({"•": ",", "|": ",", ";": ","})
+_RE_DEGREE = re.compile(
+    r"(bachelor|master|phd|doctorate|mba|bs|ba|ms|ma|bsc|msc)[^\n]*(?:in|of)?\s*([^\n,]*)",
+    re.IGNORECASE
+)
+_RE_YEAR = re.compile(r"\b(19|20)\d{2}\b")
+_RE_PROJECT_NAME = re.compile(r"^[•\-\*]?\s*([^:–-]+)")
+# Email | phone | LinkedIn | GitHub | URL, as one alternation (one scan per line)
+_RE_CONTACT = re.compile(
+    r"@"
+    r"|\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
+    r"|linkedin\.com"
+    r"|github\.com"
+    r"|http",
+    re.IGNORECASE
+)
+
+
+@dataclass
+class _ParseCtx:
+    """Normalized resume text plus derived views, computed once per parse"""
+    text: str
+    lower: str
+    lines: List[str]  # stripped, non-empty
+    sections: Dict[str, str]  # section name -> body, see SECTION_HEADERS
+    
+    @classmethod
+    def from_text(cls, text: str) -> "_ParseCtx":
+        stripped = (l.strip() for l in text.split("\n"))
+        return cls(
+            text=text,
+            lower=text.lower(),
+            lines=[l for l in stripped if l],
+            sections=_split_sections(text),
+        )
+
 
 class ResumeParserService:
     """
     Parses resumes from PDF and DOCX files
     """
     
-    def __init__(self):
+    def __init__(self, pdf_workers: Optional[int] = None):
         self.max_experience_items = 5
         self.max_skills = 30
+        # PDF engines are CPU-bound and not thread-safe, so extraction runs in
+        # worker processes (started on first use) for real parallelism
+        self._pdf_workers = pdf_workers or min(4, os.cpu_count() or 1)
+        self._pdf_pool = self._new_pdf_pool()
+        self._pdf_pool_lock = threading.Lock()
+        self._docx_read = _build_docx_reader()
+    
+    def _new_pdf_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._pdf_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    
+    def _replace_pdf_pool(self, pool: ProcessPoolExecutor, kill: bool = False) -> None:
+        """Swap in a fresh PDF pool, unless another caller already replaced `pool`"""
+        # A crashed or OOM-killed worker breaks the whole executor for good, so
+        # without this every later PDF upload would fail until a restart
+        with self._pdf_pool_lock:
+            if self._pdf_pool is pool:
+                self._pdf_pool = self._new_pdf_pool()
+        
+        if kill:
+            # A running extraction can't be cancelled; stop its processes
+            for process in list(pool._processes.values()):
+                process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def close(self):
+        """Shut down the PDF worker processes"""
+        self._pdf_pool.shutdown(wait=False, cancel_futures=True)
     
     async def parse_bytes(self, content: bytes, file_type: str) -> Dict[str, Any]:
         """Parse resume from bytes content"""
+        digest = _content_digest()
+        digest.update(content)
+        cache_key = (digest.digest(), file_type)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         if file_type == "pdf":
             text = await self._extract_pdf(content)
         elif file_type in ("docx", "doc"):
@@ -52,52 +362,89 @@ class ResumeParserService:
         else:
             text = content.decode("utf-8", errors="ignore")
         
-        return self.parse_text(text, file_type)
+        result = self.parse_text(text, file_type)
+        _cache_put(cache_key, result)
+        return result
+    
+    def parse_stream(self, stream: BinaryIO, file_type: str) -> Dict[str, Any]:
+        """Parse resume from a binary file object (blocking, run off the event loop)"""
+        # Hash in chunks, then rewind for the actual parse
+        cache_key = (hashlib.file_digest(stream, _content_digest).digest(), file_type)  # type: ignore[arg-type]
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+        stream.seek(0)
+        
+        if file_type == "pdf":
+            content = stream.read()
+            try:
+                text = self._run_pdf_job(content)
+            except BrokenProcessPool:
+                # Retry once on the replacement pool; the crash may have come
+                # from another document sharing the old one
+                text = self._run_pdf_job(content)
+        elif file_type in ("docx", "doc"):
+            text = self._read_docx(stream)
+        else:
+            text = stream.read().decode("utf-8", errors="ignore")
+        
+        result = self.parse_text(text, file_type)
+        _cache_put(cache_key, result)
+        return result
+    
+    def _run_pdf_job(self, content: bytes) -> str:
+        """Extract PDF text in the worker pool (blocking), replacing the pool if it broke"""
+        pool = self._pdf_pool
+        try:
+            return pool.submit(_extract_pdf_text, content).result(timeout=PDF_EXTRACT_TIMEOUT_SECONDS)
+        except BrokenProcessPool:
+            self._replace_pdf_pool(pool)
+            raise
+        except TimeoutError:
+            self._replace_pdf_pool(pool, kill=True)
+            raise
+    
+    async def _run_pdf_job_async(self, content: bytes) -> str:
+        """Async counterpart of _run_pdf_job"""
+        pool = self._pdf_pool
+        try:
+            future = asyncio.wrap_future(pool.submit(_extract_pdf_text, content))
+            return await asyncio.wait_for(future, PDF_EXTRACT_TIMEOUT_SECONDS)
+        except BrokenProcessPool:
+            self._replace_pdf_pool(pool)
+            raise
+        except TimeoutError:
+            self._replace_pdf_pool(pool, kill=True)
+            raise
     
     async def _extract_pdf(self, content: bytes) -> str:
         """Extract text from PDF"""
         try:
-            import pdfplumber
-            
-            with pdfplumber.open(BytesIO(content)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-                    text += "\n"
-            return text
-        except ImportError:
-            # Fallback: try PyPDF2
-            try:
-                from PyPDF2 import PdfReader
-                reader = PdfReader(BytesIO(content))
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() or ""
-                return text
-            except ImportError:
-                return "[PDF parsing requires pdfplumber or PyPDF2]"
+            return await self._run_pdf_job_async(content)
+        except BrokenProcessPool:
+            # Retry once on the replacement pool, as in parse_stream
+            return await self._run_pdf_job_async(content)
     
     async def _extract_docx(self, content: bytes) -> str:
         """Extract text from DOCX"""
-        try:
-            import docx
-            doc = docx.Document(BytesIO(content))
-            text = "\n".join([para.text for para in doc.paragraphs])
-            return text
-        except ImportError:
-            return "[DOCX parsing requires python-docx]"
+        return await asyncio.to_thread(self._read_docx, BytesIO(content))
+    
+    def _read_docx(self, stream: BinaryIO) -> str:
+        """Extract text from a DOCX file object"""
+        return self._docx_read(stream)
     
     def parse_text(self, raw_text: str, file_type: str = "txt") -> Dict[str, Any]:
         """Parse resume from raw text"""
         normalized = self._normalize_text(raw_text)
+        ctx = _ParseCtx.from_text(normalized)
         
-        name = self._extract_name(normalized)
-        title = self._extract_title(normalized)
-        summary = self._extract_summary(normalized)
-        experience = self._extract_experience(normalized)
-        skills = self._extract_skills(normalized)
-        education = self._extract_education(normalized)
-        projects = self._extract_projects(normalized)
+        name = self._extract_name(ctx)
+        title = self._extract_title(ctx)
+        summary = self._extract_summary(ctx)
+        experience = self._extract_experience(ctx)
+        skills = self._extract_skills(ctx)
+        education = self._extract_education(ctx)
+        projects = self._extract_projects(ctx)
         
         # Calculate confidence
         parse_confidence = self._calculate_confidence({
@@ -125,79 +472,65 @@ class ResumeParserService:
         """Normalize text for parsing"""
         text = text.replace("\r\n", "\n").replace("\r", "\n")
         text = text.replace("\t", " ")
-        text = re.sub(r" +", " ", text)
-        text = re.sub(r"\n\s*\n", "\n\n", text)
+        text = _RE_SPACES.sub(" ", text)
+        text = _RE_BLANK_LINES.sub("\n\n", text)
         return text.strip()
     
-    def _extract_name(self, text: str) -> Optional[str]:
+    def _extract_name(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract name from resume"""
-        lines = [l.strip() for l in text.split("\n") if l.strip()]
-        
-        for line in lines[:5]:
+        for line in ctx.lines[:5]:
+            # Name pattern: 2-4 capitalized words. Letters and spaces only, so
+            # of the contact patterns only the bare "http" can hit ("Jane
+            # Httpson"); that and a header ("Work History") are all to skip
+            if _RE_NAME.match(line):
+                if "http" in line.lower() or self._is_section_header(line):
+                    continue
+                return line
+            
             # Skip contact info
             if self._is_contact_info(line):
                 continue
             if self._is_section_header(line):
                 continue
             
-            # Name pattern: 2-4 capitalized words
-            if re.match(r'^([A-Z][a-z]+\s+){1,3}[A-Z][a-z]+$', line):
-                return line
-            
             # Fallback: first short line without special chars
             if 3 < len(line) < 50 and "@" not in line:
                 return line
         
         return None
     
-    def _extract_title(self, text: str) -> Optional[str]:
+    def _extract_title(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract job title"""
-        lines = [l.strip() for l in text.split("\n") if l.strip()]
-        
-        title_patterns = [
-            r"senior|junior|lead|principal|staff|engineer|developer|manager|director|analyst|designer|architect|consultant"
-        ]
-        
-        for line in lines[:10]:
+        for line in ctx.lines[:10]:
             if 5 < len(line) < 80:
-                for pattern in title_patterns:
-                    if re.search(pattern, line, re.IGNORECASE) and not self._is_contact_info(line):
-                        return line
+                if _RE_TITLE.search(line) and not self._is_contact_info(line):
+                    return line
         
         return None
     
-    def _extract_summary(self, text: str) -> Optional[str]:
+    def _extract_summary(self, ctx: _ParseCtx) -> Optional[str]:
         """Extract professional summary"""
-        headers = ["summary", "professional summary", "about", "profile", "objective"]
+        section = ctx.sections.get("summary")
         
-        for header in headers:
-            pattern = rf"(?:{header})[:\s]*([\s\S]*?)(?=\n\n|experience|education|skills|$)"
-            match = re.search(pattern, text, re.IGNORECASE)
-            
-            if match and match.group(1):
-                summary = match.group(1).strip()
-                if 50 < len(summary) < 1000:
-                    return summary
+        if section:
+            summary = _first_paragraph(section).strip()
+            if 50 < len(summary) < 1000:
+                return summary
         
         return None
     
-    def _extract_experience(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_experience(self, ctx: _ParseCtx) -> List[Dict[str, Any]]:
         """Extract work experience"""
-        experiences = []
+        experiences: List[Dict[str, Any]] = []
         
         # Find experience section
-        pattern = rf"(?:{'|'.join(EXPERIENCE_HEADERS)})[:\s]*([\s\S]*?)(?=\n(?:education|skills|projects|certifications)|$)"
-        match = re.search(pattern, text, re.IGNORECASE)
+        exp_section = ctx.sections.get("experience")
         
-        if not match:
+        if exp_section is None:
             return experiences
         
-        exp_section = match.group(1)
-        
         # Parse individual experiences
-        exp_pattern = r"([A-Z][^•\n]+)\s*[|•\-–]\s*([^•\n]+)\s*[|•\-–]?\s*(\d{4}\s*[-–]\s*(?:\d{4}|present|current))?"
-        
-        for match in re.finditer(exp_pattern, exp_section, re.IGNORECASE):
+        for match in _RE_EXPERIENCE_ITEM.finditer(exp_section):
             company, role, duration = match.groups()
             
             if company and role and len(experiences) < self.max_experience_items:
@@ -210,18 +543,16 @@ class ResumeParserService:
         
         return experiences
     
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, ctx: _ParseCtx) -> List[str]:
         """Extract skills"""
         skills = set()
-        lower_text = text.lower()
         
         # Extract from skills section
-        pattern = r"(?:skills|technical skills|technologies)[:\s]*([^\n]+(?:\n[^\n]+)*?)(?=\n\n|experience|education|$)"
-        match = re.search(pattern, text, re.IGNORECASE)
+        section = ctx.sections.get("skills")
         
-        if match:
-            skills_text = match.group(1)
-            items = re.split(r"[,•|;]", skills_text)
+        if section:
+            skills_text = _first_paragraph(section)
+            items = skills_text.translate(_SKILL_DELIM_TABLE).split(",")
             
             for item in items:
                 skill = item.strip().lower()
@@ -229,33 +560,27 @@ class ResumeParserService:
                     skills.add(skill)
         
         # Scan for known skills
-        for skill in SKILL_KEYWORDS:
-            if skill.lower() in lower_text:
-                skills.add(skill)
+        skills.update(_find_skill_keywords(ctx.lower))
         
         return list(skills)[:self.max_skills]
     
-    def _extract_education(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_education(self, ctx: _ParseCtx) -> List[Dict[str, Any]]:
         """Extract education"""
-        education = []
+        education: List[Dict[str, Any]] = []
         
-        pattern = r"(?:education|academic)[:\s]*([\s\S]*?)(?=\n\n|experience|skills|$)"
-        match = re.search(pattern, text, re.IGNORECASE)
+        edu_section = ctx.sections.get("education")
         
-        if not match:
+        if edu_section is None:
             return education
-        
-        edu_section = match.group(1)
+        edu_section = _first_paragraph(edu_section)
         
         # Look for degree patterns
-        degree_pattern = r"(bachelor|master|phd|doctorate|mba|bs|ba|ms|ma|bsc|msc)[^\n]*(?:in|of)?\s*([^\n,]*)"
-        
-        for match in re.finditer(degree_pattern, edu_section, re.IGNORECASE):
+        for match in _RE_DEGREE.finditer(edu_section):
             if len(education) < 3:
                 degree, field = match.groups()
                 
                 # Extract year
-                year_match = re.search(r"\b(19|20)\d{2}\b", match.group(0))
+                year_match = _RE_YEAR.search(match.group(0))
                 year = year_match.group(0) if year_match else ""
                 
                 education.append({
@@ -266,65 +591,47 @@ class ResumeParserService:
         
         return education
     
-    def _extract_projects(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_projects(self, ctx: _ParseCtx) -> List[Dict[str, Any]]:
         """Extract projects"""
-        projects = []
+        projects: List[Dict[str, Any]] = []
         
-        pattern = r"(?:projects|personal projects|side projects)[:\s]*([\s\S]*?)(?=\n\n|experience|education|skills|$)"
-        match = re.search(pattern, text, re.IGNORECASE)
+        project_section = ctx.sections.get("projects")
         
-        if not match:
+        if project_section is None:
             return projects
-        
-        project_section = match.group(1)
-        lines = [l.strip() for l in project_section.split("\n") if l.strip()]
+        lines = [l.strip() for l in _first_paragraph(project_section).split("\n") if l.strip()]
         
         for line in lines:
-            if len(line) < 10 or len(projects) >= 5:
+            if len(projects) >= 5:
+                break
+            if len(line) < 10:
                 continue
             
             # Extract project name
-            name_match = re.match(r"^[•\-\*]?\s*([^:–-]+)", line)
+            name_match = _RE_PROJECT_NAME.match(line)
             if name_match:
                 projects.append({
                     "name": name_match.group(1).strip(),
                     "description": line,
-                    "technologies": self._extract_technologies(line),
+                    # Lowered only once a line is kept (at most 5 short lines)
+                    "technologies": self._extract_technologies(line.lower()),
                 })
         
         return projects
     
-    def _extract_technologies(self, text: str) -> List[str]:
-        """Extract technologies from text"""
-        technologies = []
-        lower_text = text.lower()
-        
-        for skill in SKILL_KEYWORDS:
-            if skill.lower() in lower_text:
-                technologies.append(skill)
-        
-        return technologies[:10]
+    def _extract_technologies(self, lower_text: str) -> List[str]:
+        """Extract technologies from already-lowercased text"""
+        return _find_skill_keywords(lower_text)[:10]
     
     def _is_contact_info(self, line: str) -> bool:
         """Check if line is contact info"""
-        patterns = [
-            r"@",  # Email
-            r"\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # Phone
-            r"linkedin\.com",
-            r"github\.com",
-            r"http",
-        ]
-        return any(re.search(p, line, re.IGNORECASE) for p in patterns)
+        return _RE_CONTACT.search(line) is not None
     
     def _is_section_header(self, line: str) -> bool:
         """Check if line is section header"""
-        headers = [
-            *EXPERIENCE_HEADERS,
-            "education", "skills", "projects", "certifications", "awards",
-            "summary", "objective", "contact", "references",
-        ]
-        lower = line.lower().strip()
-        return any(lower == h or lower.startswith(h + ":") for h in headers)
+        # "skills" and "skills: python" both count; headers hold no colon, so
+        # the text before the first one is the candidate header
+        return line.lower().strip().partition(":")[0] in _SECTION_HEADER_WORDS
     
     def _calculate_confidence(self, data: Dict) -> float:
         """Calculate parsing confidence"""